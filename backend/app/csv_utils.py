@@ -2,18 +2,43 @@ from __future__ import annotations
 
 import csv
 import io
-from dataclasses import dataclass
+import os
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
 
 class CsvError(ValueError):
     pass
 
 
-@dataclass
 class ParsedCsv:
-    columns: list[str]
-    rows: list[dict[str, str]]
+    """Parsed CSV held as an Arrow table of string columns.
+
+    `rows` is materialized lazily so callers that work on columns
+    (schema inference, matrix building) never pay for per-row dicts.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        rows: list[dict[str, str]] | None = None,
+        table: pa.Table | None = None,
+    ):
+        self.columns = columns
+        self.table = table
+        self._rows = rows
+
+    @property
+    def rows(self) -> list[dict[str, str]]:
+        if self._rows is None:
+            self._rows = self.table.to_pylist() if self.table is not None else []
+        return self._rows
 
 
 def _strip_bom(text: str) -> str:
@@ -22,67 +47,137 @@ def _strip_bom(text: str) -> str:
     return text
 
 
+def _empty_string_table(header: list[str]) -> ParsedCsv:
+    # Arrow's reader refuses header-only CSVs, but a zero-row dataset is
+    # valid (e.g. clearing all rows in the editor) — build it directly
+    table = pa.table(
+        [pa.array([], type=pa.string()) for _ in header], names=[str(c) for c in header]
+    )
+    return _clean_string_table(table)
+
+
+def _clean_string_table(table: pa.Table) -> ParsedCsv:
+    # drop unnamed columns, strip header names and cell whitespace
+    keep = [i for i, c in enumerate(table.column_names) if c is not None and str(c).strip()]
+    columns = [str(table.column_names[i]).strip() for i in keep]
+    arrays = [pc.fill_null(pc.utf8_trim_whitespace(table.column(i)), "") for i in keep]
+    return ParsedCsv(columns=columns, table=pa.table(arrays, names=columns))
+
+
+def parse_csv_file(path: Any) -> ParsedCsv:
+    """Parse a CSV file by streaming record batches.
+
+    Unlike parse_csv_text, the file is never decoded into one big str:
+    Arrow reads and tokenizes blocks as they arrive.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        has_rows = next(reader, None) is not None
+    if not header:
+        raise CsvError("CSV 为空")
+    if not any(str(c).strip() for c in header):
+        raise CsvError("CSV 缺少表头")
+    if not has_rows:
+        return _empty_string_table(header)
+
+    try:
+        with pa_csv.open_csv(
+            str(path),
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=4 << 20),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                strings_can_be_null=False,
+            ),
+        ) as reader:
+            table = reader.read_all()
+    except pa.ArrowInvalid as e:
+        raise CsvError(f"CSV 解析失败: {e}")
+    return _clean_string_table(table)
+
+
 def parse_csv_text(csv_text: str) -> ParsedCsv:
     raw = _strip_bom(csv_text).strip()
     if not raw:
         raise CsvError("CSV 为空")
 
-    reader = csv.DictReader(io.StringIO(raw))
-    if not reader.fieldnames:
+    reader = csv.reader(io.StringIO(raw))
+    header = next(reader, [])
+    if not any(str(c).strip() for c in header):
         raise CsvError("CSV 缺少表头")
+    if next(reader, None) is None:
+        return _empty_string_table(header)
+
+    try:
+        table = pa_csv.read_csv(
+            pa.BufferReader(raw.encode("utf-8")),
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=1 << 20),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid as e:
+        raise CsvError(f"CSV 解析失败: {e}")
+    return _clean_string_table(table)
 
-    columns = [c.strip() for c in reader.fieldnames if c is not None and str(c).strip()]
-    rows: list[dict[str, str]] = []
-    for row in reader:
-        cleaned: dict[str, str] = {}
-        for col in columns:
-            v = row.get(col)
-            cleaned[col] = "" if v is None else str(v).strip()
-        rows.append(cleaned)
-    return ParsedCsv(columns=columns, rows=rows)
 
+def _column_array(parsed: ParsedCsv, col: str) -> pa.ChunkedArray:
+    if parsed.table is not None:
+        return parsed.table.column(col)
+    return pa.chunked_array([pa.array([r.get(col, "") for r in parsed.rows], type=pa.string())])
 
-def infer_schema(columns: list[str], rows: list[dict[str, str]]) -> dict[str, Any]:
+
+def infer_schema(parsed: ParsedCsv) -> dict[str, Any]:
     types: dict[str, str] = {}
-    for col in columns:
-        non_empty = [r.get(col, "") for r in rows if r.get(col, "").strip() != ""]
-        if not non_empty:
+    for col in parsed.columns:
+        arr = _column_array(parsed, col)
+        non_empty = pc.filter(arr, pc.not_equal(arr, ""))
+        if len(non_empty) == 0:
             types[col] = "string"
             continue
-        if col == "year":
-            ok = True
-            for v in non_empty:
-                try:
-                    int(float(v))
-                except Exception:
-                    ok = False
-                    break
-            types[col] = "int" if ok else "string"
+        # one vectorized cast per column instead of float() try/except per cell
+        as_float = cast_float64_or_none(non_empty)
+        if as_float is None:
+            types[col] = "string"
             continue
-        is_num = True
-        for v in non_empty:
-            try:
-                float(v)
-            except Exception:
-                is_num = False
-                break
-        types[col] = "number" if is_num else "string"
+        if col == "year":
+            # int(float(v)) additionally rejects nan/inf
+            types[col] = "int" if bool(pc.all(pc.is_finite(as_float)).as_py()) else "string"
+        else:
+            types[col] = "number"
 
+    row_count = parsed.table.num_rows if parsed.table is not None else len(parsed.rows)
     return {
-        "columns": columns,
+        "columns": parsed.columns,
         "types": types,
-        "rowCount": len(rows),
+        "rowCount": row_count,
         "required": ["entity", "year"],
     }
 
 
+def write_schema_json(path: Path, schema: dict[str, Any]) -> None:
+    # single place for the schema.json format (orjson writes UTF-8 directly);
+    # tmp + os.replace so a crash mid-write can't leave a torn schema.json
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+def _rows_to_table(columns: list[str], rows: list[dict[str, str]]) -> pa.Table:
+    arrays = [pa.array([r.get(c, "") for r in rows], type=pa.string()) for c in columns]
+    return pa.table(arrays, names=columns)
+
+
 def ensure_required_columns(
     parsed: ParsedCsv,
     *,
     year_override: int | None,
 ) -> ParsedCsv:
     columns = list(parsed.columns)
-    rows = [dict(r) for r in parsed.rows]
+    table = parsed.table if parsed.table is not None else _rows_to_table(columns, parsed.rows)
 
     if "entity" not in columns:
         raise CsvError("CSV 必须包含 entity 列")
@@ -91,43 +186,108 @@ def ensure_required_columns(
         if year_override is None:
             raise CsvError("CSV 缺少 year 列，请在导入时输入 year")
         columns = ["entity", "year"] + [c for c in columns if c != "entity"]
-        for r in rows:
-            r["year"] = str(int(year_override))
-
-    # normalize year
-    for r in rows:
-        y = r.get("year", "").strip()
-        if not y:
-            if year_override is None:
-                raise CsvError("存在空 year 值")
-            r["year"] = str(int(year_override))
-            continue
+        year = pa.chunked_array([pa.nulls(table.num_rows, pa.string())])
+    else:
+        year = table.column("year")
+
+    # normalize year in bulk: fill blanks, then one cast per step
+    year = pc.fill_null(year, "")
+    empty = pc.equal(year, "")
+    if pc.any(empty).as_py():
+        if year_override is None:
+            raise CsvError("存在空 year 值")
+        year = pc.if_else(empty, str(int(year_override)), year)
+    year_f = cast_float64_or_none(year)
+    if year_f is None:
+        bad = next((y for y in year.to_pylist() if not _is_float_str(y)), None)
+        raise CsvError(f"year 非数字: {bad}" if bad is not None else "year 非数字")
+    finite = pc.is_finite(year_f)
+    # pc.any (unlike pc.all) is null -> falsy on a zero-row table
+    if pc.any(pc.invert(finite)).as_py():
+        bad = year.to_pylist()[pc.index(finite, False).as_py()]
+        raise CsvError(f"year 非数字: {bad}")
+    try:
+        year_i = pc.cast(pc.trunc(year_f), pa.int64())
+    except pa.ArrowInvalid:
+        # e.g. 1e300: floatable, but truncation overflows int64
+        bad = next((y for y in year.to_pylist() if not -(2**63) <= float(y) < 2**63), None)
+        raise CsvError(f"year 非数字: {bad}" if bad is not None else "year 非数字")
+    year_norm = pc.cast(year_i, pa.string())
+
+    arrays = [year_norm if c == "year" else table.column(c) for c in columns]
+    return ParsedCsv(columns=columns, table=pa.table(arrays, names=columns))
+
+
+def cast_float64_or_none(arr: pa.Array | pa.ChunkedArray) -> pa.Array | pa.ChunkedArray | None:
+    """String array -> float64, or None if some value is not numeric.
+
+    Arrow's cast rejects a few forms Python float() accepts (full-width
+    digits, underscore literals); fall back to a Python pass for those so
+    callers keep the vectorized fast path without tightening what counts
+    as a number.
+    """
+    try:
+        return pc.cast(arr, pa.float64())
+    except pa.ArrowInvalid:
         try:
-            r["year"] = str(int(float(y)))
-        except Exception:
-            raise CsvError(f"year 非数字: {y}")
-
-    return ParsedCsv(columns=columns, rows=rows)
-
-
-def ensure_unique_entity_year(rows: list[dict[str, str]]) -> None:
-    seen: set[tuple[str, str]] = set()
-    dup: set[tuple[str, str]] = set()
-    for r in rows:
-        k = (r.get("entity", "").strip(), r.get("year", "").strip())
-        if k in seen:
-            dup.add(k)
-        seen.add(k)
-    if dup:
-        examples = ", ".join([f"({e},{y})" for e, y in list(dup)[:5]])
+            return pa.array([float(v) for v in arr.to_pylist()], type=pa.float64())
+        except (TypeError, ValueError):
+            return None
+
+
+def _is_float_str(v: str | None) -> bool:
+    try:
+        float(v)  # type: ignore[arg-type]
+    except Exception:
+        return False
+    return True
+
+
+def ensure_unique_entity_year(parsed: ParsedCsv) -> None:
+    if parsed.table is not None:
+        table = parsed.table
+        if table.num_rows == 0:
+            return
+        keys = pc.binary_join_element_wise(table.column("entity"), table.column("year"), "\x1f")
+        vc = pc.value_counts(keys)
+        dup_mask = pc.greater(vc.field("counts"), 1)
+        if pc.any(dup_mask).as_py():
+            dups = pc.filter(vc.field("values"), dup_mask)[:5].to_pylist()
+            examples = ", ".join([f"({e},{y})" for e, y in (k.split("\x1f", 1) for k in dups)])
+            raise CsvError(f"entity+year 重复（示例 {examples}）")
+        return
+
+    rows = parsed.rows
+    if not rows:
+        return
+    # pair-encode entity+year into one string array and count duplicates in C
+    ent = np.char.strip(np.asarray([r.get("entity", "") for r in rows], dtype="U"))
+    yr = np.char.strip(np.asarray([r.get("year", "") for r in rows], dtype="U"))
+    keys = np.char.add(np.char.add(ent, "\x1f"), yr)
+    uniq, counts = np.unique(keys, return_counts=True)
+    dup = uniq[counts > 1]
+    if dup.size:
+        examples = ", ".join([f"({e},{y})" for e, y in (k.split("\x1f", 1) for k in dup[:5].tolist())])
         raise CsvError(f"entity+year 重复（示例 {examples}）")
 
 
+def _write_table_csv(table: pa.Table) -> str:
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(
+        table,
+        sink,
+        write_options=pa_csv.WriteOptions(include_header=True, quoting_style="needed"),
+    )
+    return sink.getvalue().to_pybytes().decode("utf-8")
+
+
 def to_csv_text(columns: list[str], rows: list[dict[str, str]]) -> str:
-    buf = io.StringIO()
-    writer = csv.DictWriter(buf, fieldnames=columns, extrasaction="ignore", lineterminator="\n")
-    writer.writeheader()
-    for r in rows:
-        writer.writerow({c: r.get(c, "") for c in columns})
-    return buf.getvalue()
+    arrays = [pa.array([r.get(c, "") for r in rows], type=pa.string()) for c in columns]
+    return _write_table_csv(pa.table(arrays, names=columns))
+
+
+def parsed_to_csv_text(parsed: ParsedCsv) -> str:
+    if parsed.table is not None:
+        return _write_table_csv(parsed.table.select(parsed.columns))
+    return to_csv_text(parsed.columns, parsed.rows)
 
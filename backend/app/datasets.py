@@ -1,31 +1,57 @@
 from __future__ import annotations
 
 import csv
+import os
 from pathlib import Path
 from typing import Any
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from .csv_utils import CsvError, ParsedCsv, ensure_required_columns, ensure_unique_entity_year, infer_schema, parse_csv_text, to_csv_text
+from .csv_utils import CsvError, ParsedCsv, cast_float64_or_none, ensure_required_columns, ensure_unique_entity_year, infer_schema, parse_csv_file, parse_csv_text, parsed_to_csv_text
 from .storage import Store
 from .types import Direction, IndicatorRecord
 
 
 def read_csv_file(path: Path) -> ParsedCsv:
-    return parse_csv_text(path.read_text(encoding="utf-8"))
+    """Read a dataset CSV, keeping a `.arrow` sidecar as a parse cache.
+
+    The sidecar is an Arrow IPC file that mmaps back in without any CSV
+    tokenization; it is rebuilt whenever the CSV is newer.
+    """
+    cache = path.with_suffix(".arrow")
+    try:
+        if cache.exists() and cache.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            table = pa.ipc.RecordBatchFileReader(pa.memory_map(str(cache))).read_all()
+            return ParsedCsv(columns=list(table.column_names), table=table)
+    except (pa.ArrowInvalid, OSError):
+        pass  # unreadable cache: fall through and reparse
+
+    parsed = parse_csv_file(path)
+    if parsed.table is not None:
+        tmp = cache.with_suffix(".arrow.tmp")
+        try:
+            with pa.ipc.new_file(str(tmp), parsed.table.schema) as writer:
+                writer.write_table(parsed.table)
+            os.replace(tmp, cache)
+        except OSError:
+            pass  # cache is best-effort
+    return parsed
 
 
 def normalize_imported_csv(
     *,
     csv_text: str,
     year_override: int | None,
-) -> tuple[str, dict[str, Any]]:
+) -> tuple[str, dict[str, Any], ParsedCsv]:
     parsed = parse_csv_text(csv_text)
     parsed2 = ensure_required_columns(parsed, year_override=year_override)
-    ensure_unique_entity_year(parsed2.rows)
-    schema = infer_schema(parsed2.columns, parsed2.rows)
-    normalized_text = to_csv_text(parsed2.columns, parsed2.rows)
-    return normalized_text, schema
+    ensure_unique_entity_year(parsed2)
+    schema = infer_schema(parsed2)
+    normalized_text = parsed_to_csv_text(parsed2)
+    # hand the parsed table back so importers don't re-parse the text
+    return normalized_text, schema, parsed2
 
 
 def load_dataset_rows(store: Store, dataset_id: str) -> ParsedCsv:
@@ -39,10 +65,10 @@ def build_matrix_for_datasets(
     dataset_ids: list[str],
     indicator_keys: list[str],
     indicators_by_key: dict[str, IndicatorRecord],
+    dtype: Any = np.float32,
 ) -> tuple[list[str], list[int], np.ndarray, list[Direction]]:
     entities: list[str] = []
     years: list[int] = []
-    values: list[list[float]] = []
 
     directions: list[Direction] = []
     for k in indicator_keys:
@@ -51,6 +77,7 @@ def build_matrix_for_datasets(
             raise CsvError(f"指标不存在: {k}")
         directions.append(ind["direction"])
 
+    blocks: list[np.ndarray] = []
     for dataset_id in dataset_ids:
         ds = store.get_dataset(dataset_id)
         parsed = read_csv_file(Path(ds["csvPath"]))
@@ -68,31 +95,65 @@ def build_matrix_for_datasets(
         if "entity" not in parsed.columns or "year" not in parsed.columns:
             raise CsvError(f"数据集 {ds['name']} 缺少 entity/year 列")
 
-        for r in parsed.rows:
-            e = r.get("entity", "").strip()
-            y = r.get("year", "").strip()
-            if not e or not y:
-                raise CsvError(f"数据集 {ds['name']} 存在空 entity/year")
-            try:
-                yi = int(float(y))
-            except Exception:
-                raise CsvError(f"year 非数字: {y}")
-
-            row_values: list[float] = []
-            for k in indicator_keys:
-                col = col_for_key[k]
-                v = r.get(col, "").strip()
-                if v == "":
-                    raise CsvError(f"数据集 {ds['name']} 缺失值：{e}-{yi} 的列 {col}")
-                try:
-                    row_values.append(float(v))
-                except Exception:
-                    raise CsvError(f"数据集 {ds['name']} 非数值：{e}-{yi} 的列 {col}={v}")
-
-            entities.append(e)
-            years.append(yi)
-            values.append(row_values)
-
-    x = np.array(values, dtype=float)
+        table = parsed.table
+        ent = table.column("entity")
+        yr = table.column("year")
+        if pc.any(pc.or_(pc.equal(ent, ""), pc.equal(yr, ""))).as_py():
+            raise CsvError(f"数据集 {ds['name']} 存在空 entity/year")
+        yr_f = cast_float64_or_none(yr)
+        if yr_f is None:
+            bad = next((y for y in yr.to_pylist() if not _is_float(y)), None)
+            raise CsvError(f"year 非数字: {bad}" if bad is not None else "year 非数字")
+        finite = pc.is_finite(yr_f)
+        # pc.any (unlike pc.all) is null -> falsy on a zero-row table
+        if pc.any(pc.invert(finite)).as_py():
+            bad = yr.to_pylist()[pc.index(finite, False).as_py()]
+            raise CsvError(f"year 非数字: {bad}")
+        try:
+            yr_i = pc.cast(pc.trunc(yr_f), pa.int64())
+        except pa.ArrowInvalid:
+            # e.g. 1e300: floatable, but truncation overflows int64
+            bad = next((y for y in yr.to_pylist() if not -(2**63) <= float(y) < 2**63), None)
+            raise CsvError(f"year 非数字: {bad}" if bad is not None else "year 非数字")
+
+        ds_entities = ent.to_pylist()
+        ds_years = yr_i.to_pylist()
+
+        # cast each mapped column in one C call instead of float() per cell
+        cols: list[np.ndarray] = []
+        for k in indicator_keys:
+            col = col_for_key[k]
+            arr = table.column(col)
+            missing = pc.index(pc.equal(arr, ""), True).as_py()
+            if missing >= 0:
+                raise CsvError(f"数据集 {ds['name']} 缺失值：{ds_entities[missing]}-{ds_years[missing]} 的列 {col}")
+            f = cast_float64_or_none(arr)
+            if f is None:
+                bad = next(((i, v) for i, v in enumerate(arr.to_pylist()) if not _is_float(v)), None)
+                if bad is None:
+                    raise CsvError(f"数据集 {ds['name']} 列 {col} 非数值")
+                i, v = bad
+                raise CsvError(f"数据集 {ds['name']} 非数值：{ds_entities[i]}-{ds_years[i]} 的列 {col}={v}")
+            # float32 halves memory traffic on the score GEMVs; PCA upcasts
+            # internally where the covariance needs the precision
+            cols.append(f.to_numpy(zero_copy_only=False).astype(dtype, copy=False))
+
+        entities.extend(ds_entities)
+        years.extend(ds_years)
+        if cols:
+            blocks.append(np.column_stack(cols))
+
+    if blocks:
+        x = np.vstack(blocks)
+    else:
+        x = np.empty((len(entities), len(indicator_keys)), dtype=dtype)
     return entities, years, x, directions
 
+
+def _is_float(v: str) -> bool:
+    try:
+        float(v)
+    except Exception:
+        return False
+    return True
+
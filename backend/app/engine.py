@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import functools
 import math
 import uuid
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
+from scipy.special import xlogy
+
+try:  # optional: JIT-compiled kernels without NumPy temporaries
+    from numba import njit
+except ImportError:
+    njit = None
 
 from .types import Direction, IndicatorRecord, StandardizationParams, WeightMethod, now_iso
 
@@ -14,12 +21,68 @@ class ComputeError(ValueError):
     pass
 
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _entropy_e(z: np.ndarray, col_sum: np.ndarray, k: float) -> np.ndarray:
+        n, p = z.shape
+        e = np.empty(p)
+        for j in range(p):
+            s = 0.0
+            cs = col_sum[j]
+            for i in range(n):
+                pij = z[i, j] / cs
+                if pij > 0.0:
+                    s += pij * math.log(pij)
+            e[j] = -k * s
+        return e
+
+    @njit(cache=True)
+    def _perron_vector(matrix: np.ndarray) -> tuple[np.ndarray, bool]:
+        n = matrix.shape[0]
+        w = np.full(n, 1.0 / n)
+        for _ in range(64):
+            w_new = matrix @ w
+            s = w_new.sum()
+            if s == 0.0:
+                return w, False
+            w_new = w_new / s
+            diff = np.max(np.abs(w_new - w))
+            w = w_new
+            if diff < 1e-12:
+                break
+        return w, True
+
+else:
+
+    def _entropy_e(z: np.ndarray, col_sum: np.ndarray, k: float) -> np.ndarray:
+        pij = z / col_sum
+        # xlogy is branchless and defines 0*log(0) = 0
+        return -k * np.sum(xlogy(pij, pij), axis=0)
+
+    def _perron_vector(matrix: np.ndarray) -> tuple[np.ndarray, bool]:
+        n = matrix.shape[0]
+        w = np.full(n, 1.0 / n)
+        for _ in range(64):
+            w_new = matrix @ w
+            s = float(np.sum(w_new))
+            if s == 0:
+                return w, False
+            w_new /= s
+            done = bool(np.max(np.abs(w_new - w)) < 1e-12)
+            w = w_new
+            if done:
+                break
+        return w, True
+
+
 def _apply_direction(values: np.ndarray, directions: list[Direction]) -> np.ndarray:
-    x = values.copy()
-    for j, d in enumerate(directions):
-        if d == "negative":
-            x[:, j] = -x[:, j]
-    return x
+    sign = np.fromiter(
+        (-1.0 if d == "negative" else 1.0 for d in directions),
+        dtype=values.dtype,
+        count=len(directions),
+    )
+    return values * sign
 
 
 def _minmax_fit(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -28,11 +91,17 @@ def _minmax_fit(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return min_v, max_v
 
 
-def _minmax_transform(x: np.ndarray, min_v: np.ndarray, max_v: np.ndarray) -> np.ndarray:
+def _minmax_transform(
+    x: np.ndarray, min_v: np.ndarray, max_v: np.ndarray, *, inplace: bool = False
+) -> np.ndarray:
     denom = (max_v - min_v)
     if np.any(denom == 0):
         raise ComputeError("存在 max==min 的指标列，无法 min-max 标准化")
-    return (x - min_v) / denom
+    # out= keeps this to a single temporary (none at all when inplace);
+    # multiplying by the reciprocal trades p divisions for n*p products
+    out = np.subtract(x, min_v, out=x if inplace else None)
+    np.multiply(out, np.reciprocal(denom), out=out)
+    return out
 
 
 def _zscore_fit(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -41,25 +110,24 @@ def _zscore_fit(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return mean, std
 
 
-def _zscore_transform(x: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+def _zscore_transform(
+    x: np.ndarray, mean: np.ndarray, std: np.ndarray, *, inplace: bool = False
+) -> np.ndarray:
     if np.any(std == 0):
         raise ComputeError("存在 std==0 的指标列，无法 z-score 标准化")
-    return (x - mean) / std
+    out = np.subtract(x, mean, out=x if inplace else None)
+    np.multiply(out, np.reciprocal(std), out=out)
+    return out
 
 
 def _entropy_weights(z: np.ndarray) -> np.ndarray:
     # z is non-negative (after min-max), shape (n,p)
     n, p = z.shape
     col_sum = np.sum(z, axis=0)
-    if np.any(col_sum == 0):
-        # all zeros columns -> weight 0 (handled by d_j)
-        col_sum = np.where(col_sum == 0, 1.0, col_sum)
-    pij = z / col_sum
-    # avoid log(0); define 0*log0=0
-    with np.errstate(divide="ignore", invalid="ignore"):
-        logp = np.where(pij > 0, np.log(pij), 0.0)
+    # all-zero columns -> weight 0 (handled by d_j); tiny avoids a mask pass
+    col_sum = np.maximum(col_sum, np.finfo(z.dtype).tiny)
     k = 1.0 / math.log(n) if n > 1 else 0.0
-    e = -k * np.sum(pij * logp, axis=0)
+    e = _entropy_e(np.ascontiguousarray(z), col_sum, k)
     d = 1.0 - e
     d = np.where(np.isfinite(d), d, 0.0)
     total = np.sum(d)
@@ -80,28 +148,27 @@ def _pca_weights(z: np.ndarray, *, cum_var_threshold: float = 0.85) -> PcaResult
     # z: standardized (z-score), shape (n,p)
     if z.shape[0] < 2:
         raise ComputeError("PCA 训练样本量不足（至少 2 行）")
-    c = np.cov(z, rowvar=False, ddof=1)
-    eigvals, eigvecs = np.linalg.eigh(c)  # ascending
-    order = np.argsort(eigvals)[::-1]
-    eigvals = eigvals[order]
-    eigvecs = eigvecs[:, order]
+    n = z.shape[0]
+    # covariance accumulation is the one place float32 input is not enough
+    z = z.astype(np.float64, copy=False)
+    # SVD of the centered data gives the covariance eigenpairs directly,
+    # already sorted descending and with non-negative eigenvalues
+    z_c = z - z.mean(axis=0)
+    _, sv, vt = np.linalg.svd(z_c, full_matrices=False)
+    eigvals = (sv * sv) / (n - 1)
+    eigvecs = vt.T
 
-    eigvals = np.where(eigvals < 0, 0.0, eigvals)
     total = float(np.sum(eigvals))
     if total <= 0:
         raise ComputeError("PCA 协方差矩阵方差为 0")
 
     cum = np.cumsum(eigvals) / total
     k = int(np.searchsorted(cum, cum_var_threshold) + 1)
-    k = max(1, min(k, z.shape[1]))
+    k = max(1, min(k, eigvals.shape[0]))
     cumulative = float(cum[k - 1])
 
     # weight_j ∝ Σ_{l<=k} v_{jl}^2 * λ_l^2
-    w_raw = np.zeros(z.shape[1], dtype=float)
-    for l in range(k):
-        lam = float(eigvals[l])
-        v = eigvecs[:, l]
-        w_raw += (v**2) * (lam**2)
+    w_raw = ((eigvecs[:, :k] ** 2) * (eigvals[:k] ** 2)).sum(axis=1)
     s = float(np.sum(w_raw))
     if s <= 0:
         raise ComputeError("PCA 无法得到有效权重")
@@ -116,15 +183,23 @@ def _ahp_weights(matrix: np.ndarray) -> tuple[np.ndarray, float, float, float]:
     n = matrix.shape[0]
     if n < 1:
         raise ComputeError("AHP 指标数必须 >= 1")
+    m = np.ascontiguousarray(matrix, dtype=float)
+    # the same judgement matrix recurs across re-trains; key the cache on
+    # its raw bytes
+    return _ahp_weights_cached(m.tobytes(), n)
+
+
+@functools.lru_cache(maxsize=256)
+def _ahp_weights_cached(matrix_bytes: bytes, n: int) -> tuple[np.ndarray, float, float, float]:
+    matrix = np.frombuffer(matrix_bytes, dtype=float).reshape(n, n)
 
-    eigvals, eigvecs = np.linalg.eig(matrix)
-    idx = int(np.argmax(eigvals.real))
-    lambda_max = float(eigvals.real[idx])
-    vec = eigvecs[:, idx].real
-    vec = np.where(vec < 0, -vec, vec)
-    if float(np.sum(vec)) == 0:
+    # power iteration: the judgement matrix is positive, so it converges
+    # to the Perron eigenvector — no complex eig needed
+    w, ok = _perron_vector(np.ascontiguousarray(matrix))
+    if not ok:
         raise ComputeError("AHP 权重向量为 0")
-    w = vec / float(np.sum(vec))
+    # with sum(w) == 1, matrix @ w sums to lambda_max at the fixed point
+    lambda_max = float(np.sum(matrix @ w))
 
     ci = 0.0
     if n > 1:
@@ -161,6 +236,52 @@ def build_dimension2_weights(indicators: list[IndicatorRecord], weights: dict[st
     return dim
 
 
+@functools.lru_cache(maxsize=128)
+def _dimension_grouping(
+    indicator_keys: tuple[str, ...],
+    dims: tuple[str, ...],
+    weights: tuple[float, ...],
+) -> tuple[tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+    """Precompute the dimension2 grouping as arrays: (groups, w, G, active).
+
+    G[:, j] holds the group-normalized weights of group j, so all
+    sub-scores come out of a single z @ G instead of one small GEMV per
+    group. Cached because the grouping is fixed per weight model.
+    """
+    p = len(indicator_keys)
+    w = np.asarray(weights, dtype=float)
+    groups: list[str] = []
+    gid: dict[str, int] = {}
+    ids = np.empty(p, dtype=np.intp)
+    for j, g in enumerate(dims):
+        if g not in gid:
+            gid[g] = len(groups)
+            groups.append(g)
+        ids[j] = gid[g]
+
+    per_group = np.zeros(len(groups))
+    np.add.at(per_group, ids, w)
+    active = per_group > 0
+    denom = np.where(active, per_group, 1.0)
+    G = np.zeros((p, len(groups)))
+    G[np.arange(p), ids] = w / denom[ids]
+    G[:, ~active] = 0.0
+    return tuple(groups), w, G, active
+
+
+def _model_grouping(
+    indicator_keys: list[str],
+    indicators: list[IndicatorRecord],
+    weights: dict[str, float],
+) -> tuple[tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+    key_to_dim: dict[str, str] = {i["key"]: (i["dimension2Key"] or "default") for i in indicators}
+    return _dimension_grouping(
+        tuple(indicator_keys),
+        tuple(key_to_dim.get(k, "default") for k in indicator_keys),
+        tuple(float(weights[k]) for k in indicator_keys),
+    )
+
+
 def compute_scores(
     *,
     z: np.ndarray,
@@ -168,24 +289,10 @@ def compute_scores(
     indicators: list[IndicatorRecord],
     weights: dict[str, float],
 ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
-    w = np.array([float(weights[k]) for k in indicator_keys], dtype=float)
+    groups, w, G, active = _model_grouping(indicator_keys, indicators, weights)
     score_raw = z @ w
-
-    # sub-scores per dimension2 (group-normalized weights)
-    key_to_dim: dict[str, str] = {i["key"]: (i["dimension2Key"] or "default") for i in indicators}
-    dims: dict[str, list[int]] = {}
-    for idx, k in enumerate(indicator_keys):
-        g = key_to_dim.get(k, "default")
-        dims.setdefault(g, []).append(idx)
-
-    sub_scores: dict[str, np.ndarray] = {}
-    for g, idxs in dims.items():
-        wg = float(np.sum(w[idxs]))
-        if wg <= 0:
-            continue
-        w_cond = w[idxs] / wg
-        sub_scores[g] = z[:, idxs] @ w_cond
-
+    sub = z @ G
+    sub_scores = {g: sub[:, j] for j, g in enumerate(groups) if active[j]}
     return score_raw, sub_scores
 
 
@@ -196,6 +303,117 @@ def scale_0_100(values: np.ndarray, vmin: float, vmax: float) -> np.ndarray:
     return (values - vmin) / denom * 100.0
 
 
+def train_weight_models_batch(
+    *,
+    specs: list[dict[str, Any]],
+    indicator_keys: list[str],
+    indicators: list[IndicatorRecord],
+    x_train: np.ndarray,
+    directions: list[Direction],
+    trained_on_dataset_ids: list[str],
+    dtype: Any = np.float32,
+) -> list[dict[str, Any]]:
+    """Train several weight models over one pass of the data.
+
+    Each spec is {"method", "name"} plus optional "ahp_matrix" /
+    "pca_cum_var_threshold". Direction flips and each standardization
+    kind are computed at most once and shared between the specs, so a
+    caller training entropy+pca+ahp together pays the matrix work once.
+    """
+    x = _apply_direction(np.asarray(x_train, dtype=dtype), directions)
+
+    # x is a fresh buffer from _apply_direction: if only one standardization
+    # kind is in play it can be transformed in place instead of copied
+    methods = {spec["method"] for spec in specs}
+    single_kind = not ("entropy" in methods and methods & {"pca", "ahp"})
+
+    minmax_cache: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+    zscore_cache: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def _minmax() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        nonlocal minmax_cache
+        if minmax_cache is None:
+            min_v, max_v = _minmax_fit(x)
+            minmax_cache = (min_v, max_v, _minmax_transform(x, min_v, max_v, inplace=single_kind))
+        return minmax_cache
+
+    def _zscore() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        nonlocal zscore_cache
+        if zscore_cache is None:
+            mean, std = _zscore_fit(x)
+            zscore_cache = (mean, std, _zscore_transform(x, mean, std, inplace=single_kind))
+        return zscore_cache
+
+    models: list[dict[str, Any]] = []
+    for spec in specs:
+        method: WeightMethod = spec["method"]
+        if method == "entropy":
+            min_v, max_v, z = _minmax()
+            w_vec = _entropy_weights(z)
+            standardization: StandardizationParams = {
+                "kind": "minmax",
+                "min": {k: float(min_v[i]) for i, k in enumerate(indicator_keys)},
+                "max": {k: float(max_v[i]) for i, k in enumerate(indicator_keys)},
+            }
+            pca_info = None
+            ahp_info = None
+        elif method == "pca":
+            mean, std, z = _zscore()
+            threshold = float(spec.get("pca_cum_var_threshold", 0.85))
+            pca_res = _pca_weights(z, cum_var_threshold=threshold)
+            w_vec = pca_res.weights
+            standardization = {
+                "kind": "zscore",
+                "mean": {k: float(mean[i]) for i, k in enumerate(indicator_keys)},
+                "std": {k: float(std[i]) for i, k in enumerate(indicator_keys)},
+            }
+            pca_info = {"k": int(pca_res.k), "cumulative": float(pca_res.cumulative), "threshold": threshold}
+            ahp_info = None
+        elif method == "ahp":
+            ahp_matrix = spec.get("ahp_matrix")
+            if ahp_matrix is None:
+                raise ComputeError("AHP 需要判断矩阵")
+            mean, std, z = _zscore()
+            m = np.array(ahp_matrix, dtype=float)
+            w_vec, lambda_max, ci, cr = _ahp_weights(m)
+            standardization = {
+                "kind": "zscore",
+                "mean": {k: float(mean[i]) for i, k in enumerate(indicator_keys)},
+                "std": {k: float(std[i]) for i, k in enumerate(indicator_keys)},
+            }
+            pca_info = None
+            ahp_info = {"matrix": ahp_matrix, "lambdaMax": lambda_max, "CI": ci, "CR": cr}
+        else:
+            raise ComputeError(f"未知 method: {method}")
+
+        weights = {k: float(w_vec[i]) for i, k in enumerate(indicator_keys)}
+        dim_weights = build_dimension2_weights(indicators, weights)
+
+        score_raw, sub_scores = compute_scores(
+            z=z, indicator_keys=indicator_keys, indicators=indicators, weights=weights
+        )
+        score_min = float(np.min(score_raw))
+        score_max = float(np.max(score_raw))
+        sub_min = {g: float(np.min(v)) for g, v in sub_scores.items()}
+        sub_max = {g: float(np.max(v)) for g, v in sub_scores.items()}
+
+        models.append({
+            "id": uuid.uuid4().hex,
+            "name": spec["name"],
+            "createdAt": now_iso(),
+            "method": method,
+            "indicatorKeys": indicator_keys,
+            "weights": weights,
+            "dimension2Weights": dim_weights,
+            "standardization": standardization,
+            "scaling": {"scoreMin": score_min, "scoreMax": score_max, "subScoreMin": sub_min, "subScoreMax": sub_max},
+            "trainedOnDatasetIds": trained_on_dataset_ids,
+            "pca": pca_info,
+            "ahp": ahp_info,
+        })
+    return models
+
+
 def train_weight_model(
     *,
     method: WeightMethod,
@@ -207,75 +425,46 @@ def train_weight_model(
     trained_on_dataset_ids: list[str],
     ahp_matrix: list[list[float]] | None = None,
     pca_cum_var_threshold: float = 0.85,
+    dtype: Any = np.float32,
 ) -> dict[str, Any]:
-    x = _apply_direction(x_train, directions)
-
-    if method == "entropy":
-        min_v, max_v = _minmax_fit(x)
-        z = _minmax_transform(x, min_v, max_v)
-        w_vec = _entropy_weights(z)
-        standardization: StandardizationParams = {
-            "kind": "minmax",
-            "min": {k: float(min_v[i]) for i, k in enumerate(indicator_keys)},
-            "max": {k: float(max_v[i]) for i, k in enumerate(indicator_keys)},
-        }
-        pca_info = None
-        ahp_info = None
-    elif method == "pca":
-        mean, std = _zscore_fit(x)
-        z = _zscore_transform(x, mean, std)
-        pca_res = _pca_weights(z, cum_var_threshold=pca_cum_var_threshold)
-        w_vec = pca_res.weights
-        standardization = {
-            "kind": "zscore",
-            "mean": {k: float(mean[i]) for i, k in enumerate(indicator_keys)},
-            "std": {k: float(std[i]) for i, k in enumerate(indicator_keys)},
-        }
-        pca_info = {"k": int(pca_res.k), "cumulative": float(pca_res.cumulative), "threshold": float(pca_cum_var_threshold)}
-        ahp_info = None
-    elif method == "ahp":
-        if ahp_matrix is None:
-            raise ComputeError("AHP 需要判断矩阵")
-        mean, std = _zscore_fit(x)
-        z = _zscore_transform(x, mean, std)
-        m = np.array(ahp_matrix, dtype=float)
-        w_vec, lambda_max, ci, cr = _ahp_weights(m)
-        standardization = {
-            "kind": "zscore",
-            "mean": {k: float(mean[i]) for i, k in enumerate(indicator_keys)},
-            "std": {k: float(std[i]) for i, k in enumerate(indicator_keys)},
-        }
-        pca_info = None
-        ahp_info = {"matrix": ahp_matrix, "lambdaMax": lambda_max, "CI": ci, "CR": cr}
-    else:
-        raise ComputeError(f"未知 method: {method}")
-
-    weights = {k: float(w_vec[i]) for i, k in enumerate(indicator_keys)}
-    dim_weights = build_dimension2_weights(indicators, weights)
-
-    score_raw, sub_scores = compute_scores(
-        z=z, indicator_keys=indicator_keys, indicators=indicators, weights=weights
-    )
-    score_min = float(np.min(score_raw))
-    score_max = float(np.max(score_raw))
-    sub_min = {g: float(np.min(v)) for g, v in sub_scores.items()}
-    sub_max = {g: float(np.max(v)) for g, v in sub_scores.items()}
-
-    model_id = uuid.uuid4().hex
-    return {
-        "id": model_id,
-        "name": name,
-        "createdAt": now_iso(),
+    spec = {
         "method": method,
-        "indicatorKeys": indicator_keys,
-        "weights": weights,
-        "dimension2Weights": dim_weights,
-        "standardization": standardization,
-        "scaling": {"scoreMin": score_min, "scoreMax": score_max, "subScoreMin": sub_min, "subScoreMax": sub_max},
-        "trainedOnDatasetIds": trained_on_dataset_ids,
-        "pca": pca_info,
-        "ahp": ahp_info,
+        "name": name,
+        "ahp_matrix": ahp_matrix,
+        "pca_cum_var_threshold": pca_cum_var_threshold,
     }
+    return train_weight_models_batch(
+        specs=[spec],
+        indicator_keys=indicator_keys,
+        indicators=indicators,
+        x_train=x_train,
+        directions=directions,
+        trained_on_dataset_ids=trained_on_dataset_ids,
+        dtype=dtype,
+    )[0]
+
+
+def _standardization_affine(
+    std: StandardizationParams,
+    indicator_keys: list[str],
+    directions: list[Direction],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Express direction + standardization as z = x * scale - offset."""
+    sign = np.where(np.asarray(directions) == "negative", -1.0, 1.0)
+    if std["kind"] == "minmax":
+        min_v = np.array([float(std["min"][k]) for k in indicator_keys], dtype=float)
+        max_v = np.array([float(std["max"][k]) for k in indicator_keys], dtype=float)
+        denom = max_v - min_v
+        if np.any(denom == 0):
+            raise ComputeError("存在 max==min 的指标列，无法 min-max 标准化")
+        return sign / denom, min_v / denom
+    if std["kind"] == "zscore":
+        mean = np.array([float(std["mean"][k]) for k in indicator_keys], dtype=float)
+        s = np.array([float(std["std"][k]) for k in indicator_keys], dtype=float)
+        if np.any(s == 0):
+            raise ComputeError("存在 std==0 的指标列，无法 z-score 标准化")
+        return sign / s, mean / s
+    raise ComputeError("未知 standardization kind")
 
 
 def apply_weight_model(
@@ -284,26 +473,18 @@ def apply_weight_model(
     indicators: list[IndicatorRecord],
     x: np.ndarray,
     directions: list[Direction],
-) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray], dict[str, np.ndarray]]:
+) -> tuple[np.ndarray, dict[str, np.ndarray], dict[str, np.ndarray]]:
     indicator_keys: list[str] = list(model["indicatorKeys"])
     weights: dict[str, float] = dict(model["weights"])
-    x2 = _apply_direction(x, directions)
-
-    std: StandardizationParams = model["standardization"]
-    if std["kind"] == "minmax":
-        min_v = np.array([float(std["min"][k]) for k in indicator_keys], dtype=float)
-        max_v = np.array([float(std["max"][k]) for k in indicator_keys], dtype=float)
-        z = _minmax_transform(x2, min_v, max_v)
-    elif std["kind"] == "zscore":
-        mean = np.array([float(std["mean"][k]) for k in indicator_keys], dtype=float)
-        s = np.array([float(std["std"][k]) for k in indicator_keys], dtype=float)
-        z = _zscore_transform(x2, mean, s)
-    else:
-        raise ComputeError("未知 standardization kind")
 
-    score_raw, sub_scores = compute_scores(
-        z=z, indicator_keys=indicator_keys, indicators=indicators, weights=weights
-    )
+    # fold direction sign and standardization into the weight vector so
+    # scores come straight off x in one GEMV, without materializing z
+    scale, offset = _standardization_affine(model["standardization"], indicator_keys, directions)
+    groups, w, G, active = _model_grouping(indicator_keys, indicators, weights)
+    # keep the GEMVs in x's dtype (float32 matrices stay float32 throughout)
+    score_raw = x @ (scale * w).astype(x.dtype, copy=False) - np.asarray(offset @ w, dtype=x.dtype)
+    sub = x @ (scale[:, None] * G).astype(x.dtype, copy=False) - (offset @ G).astype(x.dtype, copy=False)
+    sub_scores = {g: sub[:, j] for j, g in enumerate(groups) if active[j]}
     scaling = model.get("scaling") or {}
     score_min = float(scaling.get("scoreMin", float(np.min(score_raw))))
     score_max = float(scaling.get("scoreMax", float(np.max(score_raw))))
@@ -317,5 +498,5 @@ def apply_weight_model(
         vmax = float(sub_max.get(g, float(np.max(v))))
         sub_index_0_100[g] = scale_0_100(v, vmin, vmax)
 
-    return z, score_raw, sub_scores, sub_index_0_100
+    return score_raw, sub_scores, sub_index_0_100
 
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import csv
+import functools
+import itertools
+import os
+import stat as stat_module
 import uuid
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends, FastAPI, File, HTTPException, Request, UploadFile
+import aiofiles
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from fastapi import APIRouter, Depends, FastAPI, File, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from .api_models import (
     AhpWeightModelRequest,
     ComputeRequest,
-    ComputeResponse,
     DatasetDetail,
     DatasetRowsResponse,
     DatasetSummary,
-    ImportResponse,
     ImportTextRequest,
     Indicator,
     MappingResponse,
@@ -33,10 +39,10 @@ from .api_models import (
     WeightModel,
 )
 from .config import get_settings
-from .csv_utils import CsvError, parse_csv_text, to_csv_text
-from .datasets import build_matrix_for_datasets, normalize_imported_csv
+from .csv_utils import CsvError, ParsedCsv, to_csv_text, write_schema_json
+from .datasets import build_matrix_for_datasets, normalize_imported_csv, read_csv_file
 from .engine import ComputeError, apply_weight_model, train_weight_model
-from .results import read_csv_rows, write_csv
+from .results import read_csv_rows, write_result_csv
 from .sample import seed_sample
 from .storage import Store
 from .types import IndicatorRecord, ResultSetRecord, WeightModelRecord, now_iso
@@ -66,71 +72,122 @@ def require_auth(request: Request) -> None:
 api = APIRouter(prefix="/api", dependencies=[Depends(require_auth)])
 
 
+# store records are trusted and already normalized: model_construct skips
+# validation (and drops non-field keys like csvPath), the TypeAdapter dumps
+# the whole list in one pass, and returning a Response bypasses FastAPI's
+# response_model re-validation while keeping it for the OpenAPI docs
+_dataset_list = TypeAdapter(list[DatasetSummary])
+_indicator_list = TypeAdapter(list[Indicator])
+_template_list = TypeAdapter(list[MappingTemplate])
+_weight_model_list = TypeAdapter(list[WeightModel])
+_result_list = TypeAdapter(list[ResultSummary])
+
+
+def _dump_list(adapter: TypeAdapter, model: type[BaseModel], records: list[dict[str, Any]]) -> ORJSONResponse:
+    items = [model.model_construct(**r) for r in records]
+    return ORJSONResponse(adapter.dump_python(items, mode="json"))
+
+
+def _dump_one(model: type[BaseModel], record: dict[str, Any], **extra: Any) -> ORJSONResponse:
+    item = model.model_construct(**record, **extra)
+    return ORJSONResponse(item.model_dump(mode="json"))
+
+
+# caches keyed on (path, mtime_ns): a rewrite bumps the mtime and the
+# stale entry simply ages out of the LRU
+@functools.lru_cache(maxsize=64)
+def _load_parsed(path_str: str, mtime_ns: int) -> ParsedCsv:
+    return read_csv_file(Path(path_str))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_schema(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def _parsed_for(ds: dict[str, Any]) -> ParsedCsv:
+    path = Path(ds["csvPath"])
+    return _load_parsed(str(path), path.stat().st_mtime_ns)
+
+
 def _read_schema(path: str) -> dict[str, Any]:
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    p = Path(path)
+    return _load_schema(str(p), p.stat().st_mtime_ns)
 
 
 def _dataset_preview_rows(dataset_id: str, limit: int = 50) -> list[dict[str, Any]]:
+    # bounded read: stop after `limit` data rows instead of parsing the file
     ds = store.get_dataset(dataset_id)
-    parsed = parse_csv_text(Path(ds["csvPath"]).read_text(encoding="utf-8"))
-    return parsed.rows[:limit]
+    with open(ds["csvPath"], "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        return [dict(zip(header, row)) for row in itertools.islice(reader, limit)]
+
+
+# the sample ids are fixed once seeding succeeds and no API mutates the
+# sample entities, so the serialized payload is cached for the process
+_onboarding_bytes: bytes | None = None
 
 
 @api.get("/onboarding", response_model=OnboardingResponse)
-def onboarding() -> OnboardingResponse:
-    sample_dataset_id = None
-    for ds in store.list_datasets():
-        if ds.get("isSample"):
-            sample_dataset_id = ds["id"]
-            break
-    if not sample_dataset_id:
+def onboarding() -> Response:
+    global _onboarding_bytes
+    if _onboarding_bytes is not None:
+        return Response(content=_onboarding_bytes, media_type="application/json")
+
+    sample = store.find_sample_dataset()
+    if not sample:
         raise HTTPException(404, "sample dataset not found")
+    sample_dataset_id = sample["id"]
 
     # deterministic ids if seeded, fallback to latest by method
     def pick_model(method: str) -> str:
-        models = [m for m in store.list_weight_models() if m["method"] == method and sample_dataset_id in m.get("trainedOnDatasetIds", [])]
+        models = store.weight_models_by_method_and_dataset(method, sample_dataset_id)
         if not models:
             raise HTTPException(404, f"sample weight model not found: {method}")
-        return models[0]["id"]
+        # index lists are in creation order, so the latest match is last
+        return models[-1]["id"]
 
     def pick_result(model_id: str) -> str:
-        results = [r for r in store.list_results() if r["weightModelId"] == model_id and sample_dataset_id in r["datasetIds"]]
+        results = store.results_by_model(model_id, dataset_id=sample_dataset_id)
         if not results:
             raise HTTPException(404, f"sample result not found for model: {model_id}")
-        return results[0]["id"]
+        return results[-1]["id"]
 
     entropy_model_id = pick_model("entropy")
     pca_model_id = pick_model("pca")
     ahp_model_id = pick_model("ahp")
 
-    return OnboardingResponse(
-        sampleDatasetId=sample_dataset_id,
-        weightModelIds={"entropy": entropy_model_id, "pca": pca_model_id, "ahp": ahp_model_id},
-        resultSetIds={
+    payload = {
+        "sampleDatasetId": sample_dataset_id,
+        "weightModelIds": {"entropy": entropy_model_id, "pca": pca_model_id, "ahp": ahp_model_id},
+        "resultSetIds": {
             "entropy": pick_result(entropy_model_id),
             "pca": pick_result(pca_model_id),
             "ahp": pick_result(ahp_model_id),
         },
-    )
+    }
+    _onboarding_bytes = orjson.dumps(payload)
+    return Response(content=_onboarding_bytes, media_type="application/json")
 
 
 @api.get("/datasets", response_model=list[DatasetSummary])
-def list_datasets() -> list[DatasetSummary]:
-    return [DatasetSummary(**d) for d in store.list_datasets()]
+def list_datasets() -> ORJSONResponse:
+    return _dump_list(_dataset_list, DatasetSummary, store.list_dataset_summaries())
 
 
 @api.get("/datasets/{dataset_id}", response_model=DatasetDetail)
-def get_dataset(dataset_id: str) -> DatasetDetail:
+def get_dataset(dataset_id: str) -> ORJSONResponse:
     ds = store.get_dataset(dataset_id)
     schema = _read_schema(ds["schemaPath"])
     preview_rows = _dataset_preview_rows(dataset_id, limit=50)
-    return DatasetDetail(**ds, schema=schema, previewRows=preview_rows)
+    return _dump_one(DatasetDetail, ds, schema=schema, previewRows=preview_rows)
 
 
 @api.get("/datasets/{dataset_id}/data", response_model=DatasetRowsResponse)
 def get_dataset_data(dataset_id: str) -> DatasetRowsResponse:
     ds = store.get_dataset(dataset_id)
-    parsed = parse_csv_text(Path(ds["csvPath"]).read_text(encoding="utf-8"))
+    parsed = _parsed_for(ds)
     return DatasetRowsResponse(columns=parsed.columns, rows=parsed.rows)
 
 
@@ -138,7 +195,7 @@ def get_dataset_data(dataset_id: str) -> DatasetRowsResponse:
 def put_dataset_data(dataset_id: str, req: PutDatasetRowsRequest) -> dict[str, Any]:
     # validate by reusing csv normalization rules
     csv_text = to_csv_text(req.columns, [{k: str(v) for k, v in r.items()} for r in req.rows])
-    normalized, schema = normalize_imported_csv(csv_text=csv_text, year_override=None)
+    normalized, schema, _ = normalize_imported_csv(csv_text=csv_text, year_override=None)
     store.put_dataset_files(dataset_id, normalized, schema)
     return {"ok": True}
 
@@ -149,11 +206,18 @@ def update_dataset_name(dataset_id: str, req: UpdateDatasetNameRequest) -> dict[
     return {"ok": True}
 
 
-@api.post("/datasets/import", response_model=ImportResponse)
-async def import_dataset(file: UploadFile = File(...), name: str | None = None, yearOverride: int | None = None) -> ImportResponse:
-    raw = (await file.read()).decode("utf-8", errors="ignore")
+def _normalize_upload(raw: bytes, year_override: int | None) -> tuple[str, dict[str, Any], ParsedCsv]:
+    # decode + normalize together in the worker thread; both are CPU-bound
+    return normalize_imported_csv(
+        csv_text=raw.decode("utf-8", errors="ignore"), year_override=year_override
+    )
+
+
+@api.post("/datasets/import")
+async def import_dataset(file: UploadFile = File(...), name: str | None = None, yearOverride: int | None = None) -> dict[str, Any]:
+    raw = await file.read()
     try:
-        normalized, schema = normalize_imported_csv(csv_text=raw, year_override=yearOverride)
+        normalized, schema, parsed = await asyncio.to_thread(_normalize_upload, raw, yearOverride)
     except CsvError as e:
         raise HTTPException(400, str(e))
 
@@ -162,27 +226,28 @@ async def import_dataset(file: UploadFile = File(...), name: str | None = None,
     csv_path = dataset_dir / "data.csv"
     schema_path = dataset_dir / "schema.json"
     dataset_dir.mkdir(parents=True, exist_ok=True)
-    csv_path.write_text(normalized, encoding="utf-8")
-    schema_path.write_text(json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8")
+    async with aiofiles.open(csv_path, "w", encoding="utf-8", newline="") as f:
+        await f.write(normalized)
+    async with aiofiles.open(schema_path, "wb") as f:
+        await f.write(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
 
-    parsed = parse_csv_text(normalized)
     store.create_dataset(
         dataset_id=dataset_id,
         name=name or file.filename or "Imported Dataset",
         source_type="file",
         csv_path=csv_path,
         schema_path=schema_path,
-        row_count=len(parsed.rows),
+        row_count=int(schema["rowCount"]),
         columns=parsed.columns,
         is_sample=False,
     )
-    return ImportResponse(datasetId=dataset_id)
+    return {"datasetId": dataset_id}
 
 
-@api.post("/datasets/import-text", response_model=ImportResponse)
-def import_dataset_text(req: ImportTextRequest) -> ImportResponse:
+@api.post("/datasets/import-text")
+def import_dataset_text(req: ImportTextRequest) -> dict[str, Any]:
     try:
-        normalized, schema = normalize_imported_csv(csv_text=req.csvText, year_override=req.yearOverride)
+        normalized, schema, parsed = normalize_imported_csv(csv_text=req.csvText, year_override=req.yearOverride)
     except CsvError as e:
         raise HTTPException(400, str(e))
 
@@ -192,25 +257,24 @@ def import_dataset_text(req: ImportTextRequest) -> ImportResponse:
     schema_path = dataset_dir / "schema.json"
     dataset_dir.mkdir(parents=True, exist_ok=True)
     csv_path.write_text(normalized, encoding="utf-8")
-    schema_path.write_text(json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_schema_json(schema_path, schema)
 
-    parsed = parse_csv_text(normalized)
     store.create_dataset(
         dataset_id=dataset_id,
         name=req.name or "Pasted Dataset",
         source_type="paste",
         csv_path=csv_path,
         schema_path=schema_path,
-        row_count=len(parsed.rows),
+        row_count=int(schema["rowCount"]),
         columns=parsed.columns,
         is_sample=False,
     )
-    return ImportResponse(datasetId=dataset_id)
+    return {"datasetId": dataset_id}
 
 
 @api.get("/indicators", response_model=list[Indicator])
-def list_indicators() -> list[Indicator]:
-    return [Indicator(**i) for i in store.list_indicators()]
+def list_indicators() -> ORJSONResponse:
+    return _dump_list(_indicator_list, Indicator, store.list_indicators())
 
 
 @api.post("/indicators", response_model=Indicator)
@@ -238,8 +302,8 @@ def put_mapping(dataset_id: str, req: PutMappingRequest) -> MappingResponse:
 
 
 @api.get("/mapping-templates", response_model=list[MappingTemplate])
-def list_mapping_templates() -> list[MappingTemplate]:
-    return [MappingTemplate(**t) for t in store.list_mapping_templates()]
+def list_mapping_templates() -> ORJSONResponse:
+    return _dump_list(_template_list, MappingTemplate, store.list_mapping_templates())
 
 
 @api.post("/mapping-templates", response_model=MappingTemplate)
@@ -255,15 +319,14 @@ def delete_mapping_template(name: str) -> dict[str, Any]:
 
 
 @api.get("/weight-models", response_model=list[WeightModel])
-def list_weight_models() -> list[WeightModel]:
-    return [WeightModel(**m) for m in store.list_weight_models()]
+def list_weight_models() -> ORJSONResponse:
+    return _dump_list(_weight_model_list, WeightModel, store.list_weight_models())
 
 
 @api.post("/weight-models/train", response_model=WeightModel)
 def train_model(req: TrainWeightModelRequest) -> WeightModel:
-    indicators = store.list_indicators()
-    indicators_by_key: dict[str, IndicatorRecord] = {i["key"]: i for i in indicators}
-    keys = list(req.indicatorKeys)
+    indicators_by_key: dict[str, IndicatorRecord] = store.get_indicators_by_key()
+    keys = req.indicatorKeys  # already a list after request validation
     selected = [indicators_by_key[k] for k in keys if k in indicators_by_key]
     if len(selected) != len(keys):
         missing = [k for k in keys if k not in indicators_by_key]
@@ -295,9 +358,8 @@ def train_model(req: TrainWeightModelRequest) -> WeightModel:
 
 @api.post("/weight-models/ahp", response_model=WeightModel)
 def create_ahp_model(req: AhpWeightModelRequest) -> WeightModel:
-    indicators = store.list_indicators()
-    indicators_by_key: dict[str, IndicatorRecord] = {i["key"]: i for i in indicators}
-    keys = list(req.indicatorKeys)
+    indicators_by_key: dict[str, IndicatorRecord] = store.get_indicators_by_key()
+    keys = req.indicatorKeys  # already a list after request validation
     selected = [indicators_by_key[k] for k in keys if k in indicators_by_key]
     if len(selected) != len(keys):
         missing = [k for k in keys if k not in indicators_by_key]
@@ -327,16 +389,15 @@ def create_ahp_model(req: AhpWeightModelRequest) -> WeightModel:
     return WeightModel(**model)
 
 
-@api.post("/compute", response_model=ComputeResponse)
-def compute(req: ComputeRequest) -> ComputeResponse:
+@api.post("/compute")
+def compute(req: ComputeRequest) -> dict[str, Any]:
     try:
         model = store.get_weight_model(req.weightModelId)
     except KeyError as e:
         raise HTTPException(404, str(e))
 
-    indicators = store.list_indicators()
-    indicators_by_key: dict[str, IndicatorRecord] = {i["key"]: i for i in indicators}
-    keys = list(model["indicatorKeys"])
+    indicators_by_key: dict[str, IndicatorRecord] = store.get_indicators_by_key()
+    keys = model["indicatorKeys"]
     selected = [indicators_by_key[k] for k in keys if k in indicators_by_key]
     if len(selected) != len(keys):
         raise HTTPException(400, "权重模型引用了不存在的指标")
@@ -348,7 +409,7 @@ def compute(req: ComputeRequest) -> ComputeResponse:
             indicator_keys=keys,
             indicators_by_key=indicators_by_key,
         )
-        _, score_raw, sub_scores, sub_index = apply_weight_model(
+        score_raw, sub_scores, sub_index = apply_weight_model(
             model=model,
             indicators=selected,
             x=x,
@@ -363,29 +424,13 @@ def compute(req: ComputeRequest) -> ComputeResponse:
     score_max = float(model["scaling"]["scoreMax"])
     index_0_100 = scale_0_100(score_raw, score_min, score_max)
 
-    dim_keys = sorted(sub_scores.keys())
-    columns = ["entity", "year", "score_raw", "index_0_100"]
-    for g in dim_keys:
-        columns.append(f"sub_score_raw.{g}")
-        columns.append(f"subindex.{g}_0_100")
-
-    rows: list[dict[str, Any]] = []
-    for i in range(x.shape[0]):
-        r: dict[str, Any] = {
-            "entity": entities[i],
-            "year": years[i],
-            "score_raw": float(score_raw[i]),
-            "index_0_100": float(index_0_100[i]),
-        }
-        for g in dim_keys:
-            r[f"sub_score_raw.{g}"] = float(sub_scores[g][i])
-            r[f"subindex.{g}_0_100"] = float(sub_index[g][i])
-        rows.append(r)
-
     result_id = uuid.uuid4().hex
     result_dir = store.paths.results_dir / result_id
     csv_path = result_dir / "result.csv"
-    write_csv(csv_path, columns, rows)
+    columns, row_count = write_result_csv(
+        csv_path, entities, years, score_raw, index_0_100, sub_scores, sub_index
+    )
+    st = csv_path.stat()
 
     rec: ResultSetRecord = {
         "id": result_id,
@@ -394,36 +439,73 @@ def compute(req: ComputeRequest) -> ComputeResponse:
         "datasetIds": req.datasetIds,
         "weightModelId": model["id"],
         "csvPath": str(csv_path),
-        "rowCount": len(rows),
+        "rowCount": row_count,
         "columns": columns,
+        "fileSize": st.st_size,
+        "fileMtimeNs": st.st_mtime_ns,
     }
     store.create_result(rec)
-    return ComputeResponse(resultSetId=result_id)
+    return {"resultSetId": result_id}
 
 
 @api.get("/results", response_model=list[ResultSummary])
-def list_results() -> list[ResultSummary]:
-    return [ResultSummary(**r) for r in store.list_results()]
+def list_results() -> ORJSONResponse:
+    return _dump_list(_result_list, ResultSummary, store.list_result_summaries())
 
 
 @api.get("/results/{result_id}", response_model=ResultDetail)
-def get_result(result_id: str) -> ResultDetail:
+def get_result(result_id: str) -> ORJSONResponse:
     rec = store.get_result(result_id)
     cols, rows = read_csv_rows(Path(rec["csvPath"]), limit=50)
-    return ResultDetail(**rec, previewRows=rows)
+    return _dump_one(ResultDetail, rec, previewRows=rows)
 
 
 @api.get("/results/{result_id}/rows")
-def get_result_rows(result_id: str) -> dict[str, Any]:
+def get_result_rows(result_id: str) -> StreamingResponse:
     rec = store.get_result(result_id)
-    cols, rows = read_csv_rows(Path(rec["csvPath"]), limit=None)
-    return {"columns": cols, "rows": rows}
+    path = Path(rec["csvPath"])
+
+    def gen():
+        # emit JSON incrementally so memory stays flat however many rows
+        # the result has; rows are coalesced to keep ASGI messages coarse
+        with path.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            cols = next(reader, None) or []
+            yield b'{"columns":' + orjson.dumps(cols) + b',"rows":['
+            first = True
+            buf: list[bytes] = []
+            for row in reader:
+                buf.append(orjson.dumps(dict(zip(cols, row))))
+                if len(buf) >= 500:
+                    chunk = b",".join(buf)
+                    yield chunk if first else b"," + chunk
+                    first = False
+                    buf = []
+            if buf:
+                chunk = b",".join(buf)
+                yield chunk if first else b"," + chunk
+            yield b"]}"
+
+    return StreamingResponse(gen(), media_type="application/json")
 
 
 @api.get("/results/{result_id}/download")
 def download_result(result_id: str) -> FileResponse:
     rec = store.get_result(result_id)
-    return FileResponse(path=rec["csvPath"], filename=f"{rec['name']}.csv")
+    # rebuild the stat from the record so Starlette skips its own stat();
+    # older records without the cached fields fall back to a real stat
+    stat_result = None
+    if "fileSize" in rec and "fileMtimeNs" in rec:
+        mtime = rec["fileMtimeNs"] / 1e9
+        stat_result = os.stat_result(
+            (stat_module.S_IFREG | 0o644, 0, 0, 1, 0, 0, rec["fileSize"], mtime, mtime, mtime)
+        )
+    return FileResponse(
+        path=str(rec["csvPath"]),
+        filename=f"{rec['name']}.csv",
+        stat_result=stat_result,
+        headers={"Cache-Control": "private, max-age=60", "X-Accel-Buffering": "no"},
+    )
 
 
 @api.get("/health")
@@ -431,7 +513,7 @@ def api_health() -> dict[str, Any]:
     return {"ok": True}
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,28 +1,54 @@
 from __future__ import annotations
 
 import csv
-import io
+import itertools
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 
-def read_csv_rows(path: Path, *, limit: int | None = None) -> tuple[list[str], list[dict[str, Any]]]:
-    text = path.read_text(encoding="utf-8")
-    reader = csv.DictReader(io.StringIO(text))
-    cols = reader.fieldnames or []
-    rows: list[dict[str, Any]] = []
-    for idx, r in enumerate(reader):
-        if limit is not None and idx >= limit:
-            break
-        rows.append({k: r.get(k, "") for k in cols})
-    return cols, rows
 
+def write_result_csv(
+    path: Path,
+    entities: list[str],
+    years: list[int],
+    score_raw: np.ndarray,
+    index_0_100: np.ndarray,
+    sub_scores: dict[str, np.ndarray],
+    sub_index: dict[str, np.ndarray],
+) -> tuple[list[str], int]:
+    """Write a result table straight from the score vectors.
+
+    Column names are formatted once, the numeric block is stacked and
+    string-formatted in two C-level passes (np.char.mod), and rows are
+    emitted by zipping the formatted columns — no per-cell float()/str()
+    dispatch in Python. Returns (columns, row_count) for the record.
+    """
+    dim_keys = sorted(sub_scores)
+    columns = ["entity", "year", "score_raw", "index_0_100"]
+    for g in dim_keys:
+        columns.append(f"sub_score_raw.{g}")
+        columns.append(f"subindex.{g}_0_100")
+    values = np.column_stack(
+        [score_raw, index_0_100]
+        + [a for g in dim_keys for a in (sub_scores[g], sub_index[g])]
+    )
+    cells = np.char.mod("%.6g", values)
 
-def write_csv(path: Path, columns: list[str], rows: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({c: r.get(c, "") for c in columns})
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 17) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(entities, years, *cells.T))
+    return columns, len(entities)
+
+
+def read_csv_rows(path: Path, *, limit: int | None = None) -> tuple[list[str], list[dict[str, Any]]]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        cols = next(reader, None) or []
+        # islice keeps the loop branch-free; dict(zip) beats DictReader's
+        # per-row fieldname plumbing
+        rows = [dict(zip(cols, row)) for row in itertools.islice(reader, limit)]
+    return cols, rows
 
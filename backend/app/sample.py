@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
+from .csv_utils import write_schema_json
 from .datasets import normalize_imported_csv
-from .engine import train_weight_model
-from .results import write_csv
+from .engine import train_weight_models_batch
+from .results import write_result_csv
 from .storage import Store
 from .types import IndicatorRecord, ResultSetRecord, WeightModelRecord, now_iso
 
@@ -39,11 +43,11 @@ def seed_sample(store: Store) -> dict[str, str]:
     csv_path = dataset_dir / "data.csv"
     schema_path = dataset_dir / "schema.json"
 
-    normalized_csv, schema = normalize_imported_csv(
+    normalized_csv, schema, _ = normalize_imported_csv(
         csv_text=sample_csv.read_text(encoding="utf-8"), year_override=None
     )
     csv_path.write_text(normalized_csv, encoding="utf-8")
-    schema_path.write_text(json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_schema_json(schema_path, schema)
 
     store.create_dataset(
         dataset_id=dataset_id,
@@ -57,7 +61,7 @@ def seed_sample(store: Store) -> dict[str, str]:
     )
 
     # indicators
-    indicators: list[IndicatorRecord] = json.loads(indicators_json.read_text(encoding="utf-8"))
+    indicators: list[IndicatorRecord] = orjson.loads(indicators_json.read_bytes())
     for ind in indicators:
         store.upsert_indicator(ind)
 
@@ -86,9 +90,13 @@ def seed_sample(store: Store) -> dict[str, str]:
         [1 / 3, 1 / 3, 1 / 2, 2, 1],
     ]
 
-    entropy_model: WeightModelRecord = train_weight_model(
-        method="entropy",
-        name="Sample / Entropy",
+    # one batch call: direction flips and standardizations are shared
+    entropy_model, pca_model, ahp_model = train_weight_models_batch(
+        specs=[
+            {"method": "entropy", "name": "Sample / Entropy"},
+            {"method": "pca", "name": "Sample / PCA", "pca_cum_var_threshold": 0.85},
+            {"method": "ahp", "name": "Sample / AHP", "ahp_matrix": ahp_matrix},
+        ],
         indicator_keys=indicator_keys,
         indicators=indicators,
         x_train=x_train,
@@ -97,30 +105,8 @@ def seed_sample(store: Store) -> dict[str, str]:
     )
     entropy_model["id"] = entropy_model_id
     store.create_weight_model(entropy_model)
-
-    pca_model: WeightModelRecord = train_weight_model(
-        method="pca",
-        name="Sample / PCA",
-        indicator_keys=indicator_keys,
-        indicators=indicators,
-        x_train=x_train,
-        directions=directions,
-        trained_on_dataset_ids=[dataset_id],
-        pca_cum_var_threshold=0.85,
-    )
     pca_model["id"] = pca_model_id
     store.create_weight_model(pca_model)
-
-    ahp_model: WeightModelRecord = train_weight_model(
-        method="ahp",
-        name="Sample / AHP",
-        indicator_keys=indicator_keys,
-        indicators=indicators,
-        x_train=x_train,
-        directions=directions,
-        trained_on_dataset_ids=[dataset_id],
-        ahp_matrix=ahp_matrix,
-    )
     ahp_model["id"] = ahp_model_id
     store.create_weight_model(ahp_model)
 
@@ -128,7 +114,7 @@ def seed_sample(store: Store) -> dict[str, str]:
     from .engine import apply_weight_model
 
     def compute_result(model: WeightModelRecord, result_id: str, name: str) -> None:
-        _, score_raw, sub_scores, sub_index = apply_weight_model(
+        score_raw, sub_scores, sub_index = apply_weight_model(
             model=model,
             indicators=indicators,
             x=x_train,
@@ -141,28 +127,12 @@ def seed_sample(store: Store) -> dict[str, str]:
         score_max = float(model["scaling"]["scoreMax"])
         idx0 = scale_0_100(score_raw, score_min, score_max)
 
-        columns = ["entity", "year", "score_raw", "index_0_100"]
-        dim_keys = sorted(sub_scores.keys())
-        for g in dim_keys:
-            columns.append(f"sub_score_raw.{g}")
-            columns.append(f"subindex.{g}_0_100")
-
-        rows = []
-        for i in range(x_train.shape[0]):
-            r = {
-                "entity": entities[i],
-                "year": years[i],
-                "score_raw": float(score_raw[i]),
-                "index_0_100": float(idx0[i]),
-            }
-            for g in dim_keys:
-                r[f"sub_score_raw.{g}"] = float(sub_scores[g][i])
-                r[f"subindex.{g}_0_100"] = float(sub_index[g][i])
-            rows.append(r)
-
         result_dir = store.paths.results_dir / result_id
         csv_path = result_dir / "result.csv"
-        write_csv(csv_path, columns, rows)
+        columns, row_count = write_result_csv(
+            csv_path, entities, years, score_raw, idx0, sub_scores, sub_index
+        )
+        st = csv_path.stat()
         rec: ResultSetRecord = {
             "id": result_id,
             "name": name,
@@ -170,14 +140,28 @@ def seed_sample(store: Store) -> dict[str, str]:
             "datasetIds": [dataset_id],
             "weightModelId": model["id"],
             "csvPath": str(csv_path),
-            "rowCount": len(rows),
+            "rowCount": row_count,
             "columns": columns,
+            "fileSize": st.st_size,
+            "fileMtimeNs": st.st_mtime_ns,
         }
         store.create_result(rec)
 
-    compute_result(entropy_model, entropy_result_id, "Sample Result / Entropy")
-    compute_result(pca_model, pca_result_id, "Sample Result / PCA")
-    compute_result(ahp_model, ahp_result_id, "Sample Result / AHP")
+    jobs = [
+        (entropy_model, entropy_result_id, "Sample Result / Entropy"),
+        (pca_model, pca_result_id, "Sample Result / PCA"),
+        (ahp_model, ahp_result_id, "Sample Result / AHP"),
+    ]
+    if os.environ.get("INDICATOR_SEED_SEQUENTIAL"):
+        # deterministic ordering for debugging
+        for job in jobs:
+            compute_result(*job)
+    else:
+        # independent jobs: the GEMVs release the GIL and each result
+        # writes its own directory, so three threads overlap cleanly
+        with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+            for f in [ex.submit(compute_result, *job) for job in jobs]:
+                f.result()
 
     return {
         "sampleDatasetId": dataset_id,
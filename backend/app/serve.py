@@ -8,9 +8,25 @@ import uvicorn
 def main() -> None:
     host = os.environ.get("INDICATOR_HOST", "127.0.0.1")
     port = int(os.environ.get("INDICATOR_PORT", "8000"))
-    uvicorn.run("backend.app.main:app", host=host, port=port, log_level="info")
+    # workers > 1 means one Store (and one db.json writer) per process;
+    # safe for read-heavy deployments, keep at 1 otherwise
+    workers = int(os.environ.get("INDICATOR_WORKERS", "1"))
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:  # pragma: no cover - e.g. Windows
+        loop = "auto"
+    uvicorn.run(
+        "backend.app.main:app",
+        host=host,
+        port=port,
+        loop=loop,
+        http="httptools",
+        workers=workers,
+        log_level="info",
+    )
 
 
 if __name__ == "__main__":
     main()
-
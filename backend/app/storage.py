@@ -1,13 +1,32 @@
+"""In-process record store: in-memory tables + append-only WAL + snapshots.
+
+Design note: SQLite (journal_mode=WAL) was considered as the backing
+store and would give the same properties — O(record) writes, crash-safe
+persistence, readers that don't block behind writers. The home-grown WAL
+keeps them while staying dependency-free and keeping every table as the
+plain dicts the rest of the app (orjson, response models) consumes
+directly; at this project's record counts the whole DB comfortably fits
+in memory, so there is nothing for SQL paging or queries to buy us.
+"""
+
 from __future__ import annotations
 
-import json
+import bisect
+import functools
+import os
 import shutil
+import sys
 import threading
 import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import orjson
+
+from .csv_utils import write_schema_json
 from .types import (
     DatasetRecord,
     DatasetSourceType,
@@ -24,22 +43,126 @@ from .types import (
 class StorePaths:
     root: Path
     db_json: Path
+    db_wal: Path
     datasets_dir: Path
     models_dir: Path
     results_dir: Path
 
 
+# ops between snapshot compactions; keeps replay-on-boot bounded
+_WAL_COMPACT_EVERY = 1000
+
+
+def _dataset_summary(rec: DatasetRecord) -> dict[str, Any]:
+    # the fields DatasetSummary exposes — everything but the path fields
+    return {
+        "id": rec["id"],
+        "name": rec["name"],
+        "createdAt": rec["createdAt"],
+        "sourceType": rec["sourceType"],
+        "isSample": rec["isSample"],
+        "rowCount": rec["rowCount"],
+        "columns": rec["columns"],
+    }
+
+
+def _result_summary(rec: ResultSetRecord) -> dict[str, Any]:
+    # the fields ResultSummary exposes — everything but csvPath/file stat
+    return {
+        "id": rec["id"],
+        "name": rec["name"],
+        "createdAt": rec["createdAt"],
+        "datasetIds": rec["datasetIds"],
+        "weightModelId": rec["weightModelId"],
+        "rowCount": rec["rowCount"],
+        "columns": rec["columns"],
+    }
+
+
+class _RWLock:
+    """Reader-writer lock: any number of readers, writers exclusive.
+
+    Readers are the common case (every GET hits the store), so they must
+    not serialize behind each other; writers wait for readers to drain.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writing = False
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        with self._cond:
+            while self._writing:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        with self._cond:
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
 class Store:
     def __init__(self, root: Path):
         self.paths = StorePaths(
             root=root,
             db_json=root / "db.json",
+            db_wal=root / "db.wal",
             datasets_dir=root / "datasets",
             models_dir=root / "models",
             results_dir=root / "results",
         )
-        self._lock = threading.Lock()
+        self._wal: BinaryIO | None = None
+        self._wal_ops = 0
+        # pending WAL lines, staged under the write lock and flushed to
+        # disk after it is released so I/O never blocks readers
+        self._pending: list[bytes] = []
+        self._pending_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._rw = _RWLock()
         self._db: dict[str, Any] = {}
+        # secondary indexes, rebuilt on load and maintained on insert
+        self._sample_dataset_id: str | None = None
+        self._models_by_method: dict[str, list[str]] = {}
+        self._results_by_model: dict[str, list[str]] = {}
+        # indicator key -> dataset ids whose mapping references it, so
+        # indicator deletion touches only the affected mappings
+        self._indicator_refs: dict[str, set[str]] = {}
+        # dataset dirs already ensured this process, to skip the stat+mkdir
+        self._known_dataset_dirs: set[str] = set()
+        # pre-projected list-endpoint payloads (full records minus the
+        # server-side path fields), maintained alongside the tables so
+        # listing never re-projects per request
+        self._summaries: dict[str, dict[str, dict[str, Any]]] = {}
+        # flips True on the first dataset/indicator write and never back;
+        # lets is_empty() skip the lock entirely
+        self._nonempty = False
+        # (createdAt, key) kept sorted with bisect so list_* endpoints
+        # slice instead of re-sorting the whole table per request
+        self._sorted_created: dict[str, list[tuple[str, str]]] = {}
+        self._sorted_indicator_keys: list[str] = []
+        # per-table version counters key the get-record LRU below: a bump
+        # on mutation makes stale entries unreachable, no explicit
+        # invalidation needed
+        self._versions: dict[str, int] = {}
+        self._get_cached = functools.lru_cache(maxsize=1024)(self._get_record)
 
     def ensure_dirs(self) -> None:
         self.paths.root.mkdir(parents=True, exist_ok=True)
@@ -50,41 +173,143 @@ class Store:
     def load(self) -> None:
         self.ensure_dirs()
         if self.paths.db_json.exists():
-            self._db = json.loads(self.paths.db_json.read_text(encoding="utf-8"))
-            changed = False
-            for k, default in {
+            self._db = orjson.loads(self.paths.db_json.read_bytes())
+            for k in ("datasets", "indicators", "mappings", "mappingTemplates", "weightModels", "results"):
+                self._db.setdefault(k, {})
+        else:
+            self._db = {
                 "datasets": {},
                 "indicators": {},
                 "mappings": {},
                 "mappingTemplates": {},
                 "weightModels": {},
                 "results": {},
-            }.items():
-                if k not in self._db:
-                    self._db[k] = default
-                    changed = True
-            if changed:
-                self._save()
-            return
-        self._db = {
-            "datasets": {},
-            "indicators": {},
-            "mappings": {},
-            "mappingTemplates": {},
-            "weightModels": {},
-            "results": {},
-        }
+            }
+        self._replay_wal()
+        # fold any replayed ops (and missing-table defaults) into a fresh
+        # snapshot, then start with an empty WAL
         self._save()
+        self._open_wal(truncate=True)
+        self._rebuild_indexes()
 
+    # ---- persistence ----
     def _save(self) -> None:
-        self.paths.db_json.write_text(
-            json.dumps(self._db, ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        # compact encoding: db.json is only ever read back by load(),
+        # so indentation would just double the bytes written per snapshot
+        tmp = self.paths.db_json.with_name("db.json.tmp")
+        tmp.write_bytes(orjson.dumps(self._db))
+        os.replace(tmp, self.paths.db_json)
+
+    def export_human_readable(self) -> bytes:
+        """Indented JSON dump of the whole DB, for eyeballing/debugging."""
+        with self._rw.read_locked():
+            return orjson.dumps(self._db, option=orjson.OPT_INDENT_2)
+
+    def _open_wal(self, *, truncate: bool) -> None:
+        if self._wal is not None:
+            self._wal.close()
+        mode = "wb" if truncate else "ab"
+        self._wal = open(self.paths.db_wal, mode, buffering=1 << 17)
+        self._wal_ops = 0
+
+    def _replay_wal(self) -> None:
+        if not self.paths.db_wal.exists():
+            return
+        with self.paths.db_wal.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    break  # torn tail write from a crash; ignore the rest
+                table = self._db.setdefault(op["table"], {})
+                if op["op"] == "put":
+                    table[op["key"]] = op["value"]
+                elif op["op"] == "delete":
+                    table.pop(op["key"], None)
+
+    def _append_wal(self, op: str, table: str, key: str, value: Any = None) -> None:
+        """Stage one mutation line; called with the write lock held.
+
+        Only the orjson encode happens here — the actual disk append is
+        done by _flush_wal() after the data lock is released, so other
+        store calls are never blocked behind file I/O.
+        """
+        rec: dict[str, Any] = {"op": op, "table": table, "key": key}
+        if value is not None:
+            rec["value"] = value
+        with self._pending_lock:
+            self._pending.append(orjson.dumps(rec) + b"\n")
+
+    def _flush_wal(self) -> None:
+        """Write staged WAL lines; called without the data lock.
+
+        Concurrent mutators that raced ahead get their lines coalesced
+        into one write. Every _WAL_COMPACT_EVERY ops the log is folded
+        into a fresh db.json snapshot so boot replay stays bounded.
+        """
+        need_compact = False
+        with self._io_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            if pending:
+                self._wal.write(b"".join(pending))
+                self._wal.flush()
+                self._wal_ops += len(pending)
+                need_compact = self._wal_ops >= _WAL_COMPACT_EVERY
+        if need_compact:
+            self.compact()
+
+    def compact(self) -> None:
+        # exclusive on both locks: no mutators, no concurrent flusher.
+        # staged lines are already reflected in _db, so they are dropped
+        # along with the truncated log
+        with self._rw.write_locked():
+            with self._io_lock:
+                with self._pending_lock:
+                    self._pending = []
+                self._save()
+                self._open_wal(truncate=True)
+
+    def _rebuild_indexes(self) -> None:
+        self._sample_dataset_id = next(
+            (d["id"] for d in self._db["datasets"].values() if d.get("isSample")), None
         )
+        self._models_by_method = {}
+        for m in self._db["weightModels"].values():
+            self._models_by_method.setdefault(m["method"], []).append(m["id"])
+        self._results_by_model = {}
+        for r in self._db["results"].values():
+            self._results_by_model.setdefault(r["weightModelId"], []).append(r["id"])
+        self._versions = {t: self._versions.get(t, 0) + 1 for t in self._db}
+        self._indicator_refs = {}
+        for ds_id, m in self._db["mappings"].items():
+            for key in m["map"]:
+                self._indicator_refs.setdefault(key, set()).add(ds_id)
+        self._sorted_created = {
+            t: sorted((rec["createdAt"], key) for key, rec in self._db[t].items())
+            for t in ("datasets", "mappingTemplates", "weightModels", "results")
+        }
+        self._sorted_indicator_keys = sorted(self._db["indicators"])
+        self._summaries = {
+            "datasets": {k: _dataset_summary(r) for k, r in self._db["datasets"].items()},
+            "results": {k: _result_summary(r) for k, r in self._db["results"].items()},
+        }
+        self._nonempty = bool(self._db["datasets"]) or bool(self._db["indicators"])
+
+    def _get_record(self, table: str, key: str, version: int) -> Any:
+        _ = version  # part of the cache key only
+        with self._rw.read_locked():
+            return self._db[table].get(key)
 
     def snapshot(self) -> dict[str, Any]:
-        with self._lock:
-            return json.loads(json.dumps(self._db))
+        # mutations replace table dicts (and records) wholesale instead of
+        # editing them in place, so sharing references here is safe: the
+        # snapshot keeps pointing at the tables as they were
+        with self._rw.read_locked():
+            return dict(self._db)
 
     # ---- dataset ----
     def create_dataset(
@@ -99,7 +324,7 @@ class Store:
         is_sample: bool = False,
         dataset_id: str | None = None,
     ) -> DatasetRecord:
-        with self._lock:
+        with self._rw.write_locked():
             dataset_id = dataset_id or uuid.uuid4().hex
             rec: DatasetRecord = {
                 "id": dataset_id,
@@ -110,169 +335,289 @@ class Store:
                 "csvPath": str(csv_path),
                 "schemaPath": str(schema_path),
                 "rowCount": row_count,
-                "columns": columns,
+                "columns": [sys.intern(c) for c in columns],
             }
-            self._db["datasets"][dataset_id] = rec
-            self._save()
-            return rec
+            self._db["datasets"] = {**self._db["datasets"], dataset_id: rec}
+            if is_sample and self._sample_dataset_id is None:
+                self._sample_dataset_id = dataset_id
+            bisect.insort(self._sorted_created["datasets"], (rec["createdAt"], dataset_id))
+            self._summaries["datasets"][dataset_id] = _dataset_summary(rec)
+            self._versions["datasets"] += 1
+            self._nonempty = True
+            self._append_wal("put", "datasets", dataset_id, rec)
+        self._flush_wal()
+        return rec
 
     def list_datasets(self) -> list[DatasetRecord]:
-        with self._lock:
-            values = list(self._db["datasets"].values())
-        values.sort(key=lambda d: d["createdAt"], reverse=True)
-        return values
+        with self._rw.read_locked():
+            table = self._db["datasets"]
+            return [table[k] for _, k in reversed(self._sorted_created["datasets"])]
+
+    def list_dataset_summaries(self) -> list[dict[str, Any]]:
+        # list-endpoint projection: full records minus server-side paths
+        with self._rw.read_locked():
+            summaries = self._summaries["datasets"]
+            return [summaries[k] for _, k in reversed(self._sorted_created["datasets"])]
 
     def get_dataset(self, dataset_id: str) -> DatasetRecord:
-        with self._lock:
-            rec = self._db["datasets"].get(dataset_id)
+        rec = self._get_cached("datasets", dataset_id, self._versions["datasets"])
         if not rec:
             raise KeyError(f"dataset not found: {dataset_id}")
         return rec
 
     def update_dataset_name(self, dataset_id: str, name: str) -> None:
-        with self._lock:
+        with self._rw.write_locked():
             if dataset_id not in self._db["datasets"]:
                 raise KeyError(f"dataset not found: {dataset_id}")
-            self._db["datasets"][dataset_id]["name"] = name
-            self._save()
-
-    def put_dataset_files(self, dataset_id: str, csv_text: str, schema: dict[str, Any]) -> None:
+            rec = {**self._db["datasets"][dataset_id], "name": name}
+            self._db["datasets"] = {**self._db["datasets"], dataset_id: rec}
+            self._summaries["datasets"][dataset_id] = _dataset_summary(rec)
+            self._versions["datasets"] += 1
+            self._append_wal("put", "datasets", dataset_id, rec)
+        self._flush_wal()
+
+    def put_dataset_files(
+        self, dataset_id: str, csv_data: str | Iterable[bytes], schema: dict[str, Any]
+    ) -> None:
         dataset_dir = self.paths.datasets_dir / dataset_id
-        dataset_dir.mkdir(parents=True, exist_ok=True)
+        if dataset_id not in self._known_dataset_dirs:
+            dataset_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dataset_dirs.add(dataset_id)
         csv_path = dataset_dir / "data.csv"
         schema_path = dataset_dir / "schema.json"
-        csv_path.write_text(csv_text, encoding="utf-8")
-        schema_path.write_text(json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8")
-        with self._lock:
+        # tmp + os.replace: a crash mid-write must not corrupt the dataset
+        # a reader (or the .arrow cache check) may be using right now;
+        # byte chunks stream through a 128 KiB buffer so a large upload
+        # never needs a second in-memory copy
+        tmp = csv_path.with_name("data.csv.tmp")
+        with open(tmp, "wb", buffering=1 << 17) as f:
+            if isinstance(csv_data, str):
+                f.write(csv_data.encode("utf-8"))
+            else:
+                for chunk in csv_data:
+                    f.write(chunk)
+        os.replace(tmp, csv_path)
+        write_schema_json(schema_path, schema)
+        with self._rw.write_locked():
             if dataset_id not in self._db["datasets"]:
                 raise KeyError(f"dataset not found: {dataset_id}")
-            self._db["datasets"][dataset_id]["csvPath"] = str(csv_path)
-            self._db["datasets"][dataset_id]["schemaPath"] = str(schema_path)
-            self._db["datasets"][dataset_id]["rowCount"] = int(schema.get("rowCount", 0))
-            self._db["datasets"][dataset_id]["columns"] = list(schema.get("columns", []))
-            self._save()
+            rec = {
+                **self._db["datasets"][dataset_id],
+                "csvPath": str(csv_path),
+                "schemaPath": str(schema_path),
+                "rowCount": int(schema.get("rowCount", 0)),
+                "columns": [sys.intern(c) for c in schema.get("columns", [])],
+            }
+            self._db["datasets"] = {**self._db["datasets"], dataset_id: rec}
+            self._summaries["datasets"][dataset_id] = _dataset_summary(rec)
+            self._versions["datasets"] += 1
+            self._append_wal("put", "datasets", dataset_id, rec)
+        self._flush_wal()
 
     # ---- indicators ----
     def list_indicators(self) -> list[IndicatorRecord]:
-        with self._lock:
-            values = list(self._db["indicators"].values())
-        values.sort(key=lambda i: i["key"])
-        return values
+        with self._rw.read_locked():
+            table = self._db["indicators"]
+            return [table[k] for k in self._sorted_indicator_keys]
+
+    def get_indicators_by_key(self) -> dict[str, IndicatorRecord]:
+        # the indicators table is already keyed by indicator key; hand the
+        # dict out directly (callers treat it as read-only)
+        with self._rw.read_locked():
+            return self._db["indicators"]
 
     def upsert_indicator(self, indicator: IndicatorRecord) -> None:
-        with self._lock:
-            self._db["indicators"][indicator["key"]] = indicator
-            self._save()
+        # indicator keys and dimension keys recur across mappings, weight
+        # models and templates; interning collapses them to one shared str
+        indicator["key"] = sys.intern(indicator["key"])
+        indicator["dimension2Key"] = sys.intern(indicator["dimension2Key"])
+        with self._rw.write_locked():
+            key = indicator["key"]
+            if key not in self._db["indicators"]:
+                bisect.insort(self._sorted_indicator_keys, key)
+            self._db["indicators"] = {**self._db["indicators"], key: indicator}
+            self._versions["indicators"] += 1
+            self._nonempty = True
+            self._append_wal("put", "indicators", key, indicator)
+        self._flush_wal()
 
     def delete_indicator(self, key: str) -> None:
-        with self._lock:
-            self._db["indicators"].pop(key, None)
-            # also remove from mappings
-            for m in self._db["mappings"].values():
-                if key in m["map"]:
-                    del m["map"][key]
-            self._save()
+        with self._rw.write_locked():
+            if key in self._db["indicators"]:
+                i = bisect.bisect_left(self._sorted_indicator_keys, key)
+                del self._sorted_indicator_keys[i]
+            self._db["indicators"] = {k: v for k, v in self._db["indicators"].items() if k != key}
+            self._versions["indicators"] += 1
+            self._append_wal("delete", "indicators", key)
+            # also remove from mappings — only the ones that reference it
+            affected = self._indicator_refs.pop(key, ())
+            if affected:
+                mappings = dict(self._db["mappings"])
+                for ds_id in affected:
+                    m = mappings[ds_id]
+                    rec = {**m, "map": {k: v for k, v in m["map"].items() if k != key}}
+                    mappings[ds_id] = rec
+                    self._append_wal("put", "mappings", ds_id, rec)
+                self._db["mappings"] = mappings
+        self._flush_wal()
 
     def get_indicator(self, key: str) -> IndicatorRecord:
-        with self._lock:
-            rec = self._db["indicators"].get(key)
+        rec = self._get_cached("indicators", key, self._versions["indicators"])
         if not rec:
             raise KeyError(f"indicator not found: {key}")
         return rec
 
     # ---- mappings ----
     def get_mapping(self, dataset_id: str) -> MappingRecord:
-        with self._lock:
+        with self._rw.read_locked():
             rec = self._db["mappings"].get(dataset_id)
         if not rec:
             return {"datasetId": dataset_id, "map": {}}
         return rec
 
     def put_mapping(self, dataset_id: str, mapping: dict[str, str]) -> MappingRecord:
-        rec: MappingRecord = {"datasetId": dataset_id, "map": dict(mapping)}
-        with self._lock:
-            self._db["mappings"][dataset_id] = rec
-            self._save()
+        # this comprehension doubles as the store-owned copy: it interns
+        # the indicator keys and column names (shared with indicators,
+        # weight models and dataset columns) while detaching from the
+        # caller's dict
+        rec: MappingRecord = {
+            "datasetId": dataset_id,
+            "map": {sys.intern(k): sys.intern(v) for k, v in mapping.items()},
+        }
+        with self._rw.write_locked():
+            old = self._db["mappings"].get(dataset_id)
+            old_keys = set(old["map"]) if old else set()
+            new_keys = set(rec["map"])
+            for key in new_keys - old_keys:
+                self._indicator_refs.setdefault(key, set()).add(dataset_id)
+            for key in old_keys - new_keys:
+                refs = self._indicator_refs.get(key)
+                if refs:
+                    refs.discard(dataset_id)
+            self._db["mappings"] = {**self._db["mappings"], dataset_id: rec}
+            self._append_wal("put", "mappings", dataset_id, rec)
+        self._flush_wal()
         return rec
 
     # ---- mapping templates ----
     def list_mapping_templates(self) -> list[MappingTemplateRecord]:
-        with self._lock:
-            values = list(self._db["mappingTemplates"].values())
-        values.sort(key=lambda t: t["createdAt"], reverse=True)
-        return values
+        with self._rw.read_locked():
+            table = self._db["mappingTemplates"]
+            return [table[k] for _, k in reversed(self._sorted_created["mappingTemplates"])]
 
     def get_mapping_template(self, name: str) -> MappingTemplateRecord:
-        with self._lock:
+        with self._rw.read_locked():
             rec = self._db["mappingTemplates"].get(name)
         if not rec:
             raise KeyError(f"mapping template not found: {name}")
         return rec
 
     def upsert_mapping_template(self, name: str, mapping: dict[str, str]) -> MappingTemplateRecord:
-        with self._lock:
+        with self._rw.write_locked():
             existing = self._db["mappingTemplates"].get(name)
             created_at = existing["createdAt"] if existing else now_iso()
-            rec: MappingTemplateRecord = {"name": name, "createdAt": created_at, "map": dict(mapping)}
-            self._db["mappingTemplates"][name] = rec
-            self._save()
+            if existing is None:
+                bisect.insort(self._sorted_created["mappingTemplates"], (created_at, name))
+            # same ownership contract as put_mapping: no copy, no caller
+            # mutation after the call
+            rec: MappingTemplateRecord = {"name": name, "createdAt": created_at, "map": mapping}
+            self._db["mappingTemplates"] = {**self._db["mappingTemplates"], name: rec}
+            self._append_wal("put", "mappingTemplates", name, rec)
+        self._flush_wal()
         return rec
 
     def delete_mapping_template(self, name: str) -> None:
-        with self._lock:
-            self._db["mappingTemplates"].pop(name, None)
-            self._save()
+        with self._rw.write_locked():
+            existing = self._db["mappingTemplates"].get(name)
+            if existing is not None:
+                i = bisect.bisect_left(
+                    self._sorted_created["mappingTemplates"], (existing["createdAt"], name)
+                )
+                del self._sorted_created["mappingTemplates"][i]
+            self._db["mappingTemplates"] = {
+                k: v for k, v in self._db["mappingTemplates"].items() if k != name
+            }
+            self._append_wal("delete", "mappingTemplates", name)
+        self._flush_wal()
 
     # ---- weight models ----
     def create_weight_model(self, model: WeightModelRecord) -> WeightModelRecord:
-        with self._lock:
-            self._db["weightModels"][model["id"]] = model
-            self._save()
+        with self._rw.write_locked():
+            self._db["weightModels"] = {**self._db["weightModels"], model["id"]: model}
+            self._models_by_method.setdefault(model["method"], []).append(model["id"])
+            bisect.insort(self._sorted_created["weightModels"], (model["createdAt"], model["id"]))
+            self._versions["weightModels"] += 1
+            self._append_wal("put", "weightModels", model["id"], model)
+        self._flush_wal()
         return model
 
+    def weight_models_by_method_and_dataset(self, method: str, dataset_id: str) -> list[WeightModelRecord]:
+        with self._rw.read_locked():
+            models = [self._db["weightModels"][i] for i in self._models_by_method.get(method, [])]
+        return [m for m in models if dataset_id in m.get("trainedOnDatasetIds", [])]
+
     def list_weight_models(self) -> list[WeightModelRecord]:
-        with self._lock:
-            values = list(self._db["weightModels"].values())
-        values.sort(key=lambda m: m["createdAt"], reverse=True)
-        return values
+        with self._rw.read_locked():
+            table = self._db["weightModels"]
+            return [table[k] for _, k in reversed(self._sorted_created["weightModels"])]
 
     def get_weight_model(self, model_id: str) -> WeightModelRecord:
-        with self._lock:
-            rec = self._db["weightModels"].get(model_id)
+        rec = self._get_cached("weightModels", model_id, self._versions["weightModels"])
         if not rec:
             raise KeyError(f"weight model not found: {model_id}")
         return rec
 
     # ---- results ----
     def create_result(self, result: ResultSetRecord) -> ResultSetRecord:
-        with self._lock:
-            self._db["results"][result["id"]] = result
-            self._save()
+        with self._rw.write_locked():
+            self._db["results"] = {**self._db["results"], result["id"]: result}
+            self._results_by_model.setdefault(result["weightModelId"], []).append(result["id"])
+            bisect.insort(self._sorted_created["results"], (result["createdAt"], result["id"]))
+            self._summaries["results"][result["id"]] = _result_summary(result)
+            self._versions["results"] += 1
+            self._append_wal("put", "results", result["id"], result)
+        self._flush_wal()
         return result
 
+    def results_by_model(self, model_id: str, *, dataset_id: str | None = None) -> list[ResultSetRecord]:
+        with self._rw.read_locked():
+            results = [self._db["results"][i] for i in self._results_by_model.get(model_id, [])]
+        if dataset_id is not None:
+            results = [r for r in results if dataset_id in r["datasetIds"]]
+        return results
+
     def list_results(self) -> list[ResultSetRecord]:
-        with self._lock:
-            values = list(self._db["results"].values())
-        values.sort(key=lambda r: r["createdAt"], reverse=True)
-        return values
+        with self._rw.read_locked():
+            table = self._db["results"]
+            return [table[k] for _, k in reversed(self._sorted_created["results"])]
+
+    def list_result_summaries(self) -> list[dict[str, Any]]:
+        with self._rw.read_locked():
+            summaries = self._summaries["results"]
+            return [summaries[k] for _, k in reversed(self._sorted_created["results"])]
 
     def get_result(self, result_id: str) -> ResultSetRecord:
-        with self._lock:
-            rec = self._db["results"].get(result_id)
+        rec = self._get_cached("results", result_id, self._versions["results"])
         if not rec:
             raise KeyError(f"result not found: {result_id}")
         return rec
 
     # ---- sample init ----
+    def find_sample_dataset(self) -> DatasetRecord | None:
+        with self._rw.read_locked():
+            sid = self._sample_dataset_id
+            return self._db["datasets"].get(sid) if sid else None
+
     def is_empty(self) -> bool:
-        with self._lock:
-            datasets = self._db.get("datasets", {})
-            indicators = self._db.get("indicators", {})
-        return len(datasets) == 0 and len(indicators) == 0
+        # lock-free: _nonempty only ever flips False -> True, so a racy
+        # read is at worst momentarily stale
+        return not self._nonempty
 
     def copy_sample_dataset(self, *, sample_csv: Path, dataset_id: str, name: str) -> Path:
         dataset_dir = self.paths.datasets_dir / dataset_id
         dataset_dir.mkdir(parents=True, exist_ok=True)
         csv_path = dataset_dir / "data.csv"
-        shutil.copyfile(sample_csv, csv_path)
+        # 1 MiB chunks amortize read/write syscalls on big sample files
+        with open(sample_csv, "rb") as src, open(csv_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=1024 * 1024)
         return csv_path
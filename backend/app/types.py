@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Literal, TypedDict
+import time
+from datetime import datetime, timezone
+from typing import Literal, NotRequired, TypedDict
 
 
+# Records are deliberately TypedDicts rather than slotted dataclasses:
+# they come straight out of orjson.loads on boot/WAL replay, go straight
+# back into orjson.dumps on persist, and are splatted into the API
+# response models — all of which want plain dicts. A class-based
+# representation would trade that zero-copy round-trip for per-record
+# conversion at every one of those boundaries.
+
 Direction = Literal["positive", "negative"]
 WeightMethod = Literal["entropy", "pca", "ahp"]
 DatasetSourceType = Literal["file", "paste", "manual", "sample"]
@@ -86,7 +94,24 @@ class ResultSetRecord(TypedDict):
     csvPath: str
     rowCount: int
     columns: list[str]
+    # stat captured at creation so downloads can skip the syscall;
+    # absent on records written before these fields existed
+    fileSize: NotRequired[int]
+    fileMtimeNs: NotRequired[int]
+
+
+# timestamps are second-granular, so bulk creates in the same wall-clock
+# second can share one formatted string instead of a datetime each; the
+# (sec, text) pair is rebound as one tuple so concurrent callers can
+# never observe the new second paired with the old string
+_now_cache: tuple[int, str] = (0, "")
 
 
 def now_iso() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    global _now_cache
+    s = int(time.time())
+    sec, text = _now_cache
+    if s != sec:
+        text = datetime.fromtimestamp(s, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+        _now_cache = (s, text)
+    return text